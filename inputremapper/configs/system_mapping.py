@@ -48,6 +48,8 @@ class SystemMapping:
         self._mapping = None
         self._xmodmap = None
         self._case_insensitive_mapping = None
+        self._correct_case_cache = {}
+        self._list_names_cache = {}
 
     def __getattribute__(self, wanted):
         """To lazy load system_mapping info only when needed.
@@ -76,14 +78,31 @@ class SystemMapping:
         if not codes:
             return self._mapping.keys()
 
-        return [name for name, code in self._mapping.items() if code in codes]
+        # the autocompletion asks for the same codes over and over again.
+        # Creating a frozenset from a frozenset doesn't copy it.
+        codes = frozenset(codes)
+        names = self._list_names_cache.get(codes)
+        if names is None:
+            names = tuple(name for name, code in self._mapping.items() if code in codes)
+            self._list_names_cache[codes] = names
+
+        return names
 
     def correct_case(self, symbol):
         """Return the correct casing for a symbol."""
+        # this is called whenever the editor saves, usually for the same few symbols
+        correct_case_cache = self._correct_case_cache
+        if symbol in correct_case_cache:
+            return correct_case_cache[symbol]
+
         if symbol in self._mapping:
-            return symbol
-        # only if not e.g. both "a" and "A" are in the mapping
-        return self._case_insensitive_mapping.get(symbol.lower(), symbol)
+            correct_case = symbol
+        else:
+            # only if not e.g. both "a" and "A" are in the mapping
+            correct_case = self._case_insensitive_mapping.get(symbol.lower(), symbol)
+
+        correct_case_cache[symbol] = correct_case
+        return correct_case
 
     def populate(self):
         """Get a mapping of all available names to their keycodes."""
@@ -148,6 +167,8 @@ class SystemMapping:
         """Map name to code."""
         self._mapping[str(name)] = code
         self._case_insensitive_mapping[str(name).lower()] = name
+        self._correct_case_cache.clear()
+        self._list_names_cache.clear()
 
     def get(self, name):
         """Return the code mapped to the key."""
@@ -165,6 +186,9 @@ class SystemMapping:
         for key in keys:
             del self._mapping[key]
 
+        self._correct_case_cache.clear()
+        self._list_names_cache.clear()
+
     def get_name(self, code):
         """Get the first matching name for the code."""
         for entry in self._xmodmap:
@@ -19,7 +19,9 @@
 
 from __future__ import annotations
 
+import functools
 import itertools
+import re
 
 from typing import Tuple, Iterable
 
@@ -43,6 +45,58 @@ DIFFICULT_COMBINATIONS = [
 ]
 
 
+@functools.lru_cache(maxsize=None)
+def _get_event_names():
+    """Map (type, code) to the first name evdev knows for it.
+
+    Built on first use, since only the GUI needs it and not the service.
+    """
+    return {
+        (ev_type, code): name[0] if isinstance(name, list) else name
+        for ev_type, names in ecodes.bytype.items()
+        for code, name in names.items()
+    }
+
+
+# parts of evdev names and their human readable replacements
+PRETTY_NAMES = {
+    "ABS_Z": "Trigger Left",
+    "ABS_RZ": "Trigger Right",
+    "ABS_HAT0X": "DPad",
+    "ABS_HAT0Y": "DPad",
+    "ABS_HAT1X": "DPad 2",
+    "ABS_HAT1Y": "DPad 2",
+    "ABS_HAT2X": "DPad 3",
+    "ABS_HAT2Y": "DPad 3",
+    "ABS_X": "Joystick",
+    "ABS_Y": "Joystick",
+    "ABS_RX": "Joystick 2",
+    "ABS_RY": "Joystick 2",
+    "BTN_": "Button ",
+    "KEY_": "",
+    "REL_": "",
+    "HWHEEL": "Wheel",
+    "WHEEL": "Wheel",
+    "_": " ",
+}
+
+# longer names first, so that for example "BTN_" is preferred over "_"
+PRETTY_NAMES_PATTERN = re.compile(
+    "|".join(re.escape(name) for name in sorted(PRETTY_NAMES, key=len, reverse=True))
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _prettify(key_name: str) -> str:
+    """Turn names like "ABS_HAT0X Left" into something readable like "DPad Left".
+
+    This only depends on the name, which makes it cacheable, unlike the lookup of the
+    name itself, which might change when the xmodmap of the system changes.
+    """
+    key_name = PRETTY_NAMES_PATTERN.sub(lambda match: PRETTY_NAMES[match[0]], key_name)
+    return key_name.replace("  ", " ")
+
+
 class EventCombination(Tuple[InputEvent]):
     """one or multiple InputEvent objects for use as an unique identifier for mappings"""
 
@@ -133,13 +187,13 @@ class EventCombination(Tuple[InputEvent]):
 
         for event in self:
 
-            if event.type not in ecodes.bytype:
-                logger.error("Unknown type for %s", event)
-                result.append(str(event.code))
-                continue
+            event_name = _get_event_names().get(event.type_and_code)
+            if event_name is None:
+                if event.type not in ecodes.bytype:
+                    logger.error("Unknown type for %s", event)
+                else:
+                    logger.error("Unknown combination code for %s", event)
 
-            if event.code not in ecodes.bytype[event.type]:
-                logger.error("Unknown combination code for %s", event)
                 result.append(str(event.code))
                 continue
 
@@ -154,9 +208,7 @@ class EventCombination(Tuple[InputEvent]):
                 # if no result, look in the linux combination constants. On a german
                 # keyboard for example z and y are switched, which will therefore
                 # cause the wrong letter to be displayed.
-                key_name = ecodes.bytype[event.type][event.code]
-                if isinstance(key_name, list):
-                    key_name = key_name[0]
+                key_name = event_name
 
             if event.type != ecodes.EV_KEY:
                 direction = {
@@ -191,31 +243,6 @@ class EventCombination(Tuple[InputEvent]):
                 if direction is not None:
                     key_name += f" {direction}"
 
-            key_name = key_name.replace("ABS_Z", "Trigger Left")
-            key_name = key_name.replace("ABS_RZ", "Trigger Right")
-
-            key_name = key_name.replace("ABS_HAT0X", "DPad")
-            key_name = key_name.replace("ABS_HAT0Y", "DPad")
-            key_name = key_name.replace("ABS_HAT1X", "DPad 2")
-            key_name = key_name.replace("ABS_HAT1Y", "DPad 2")
-            key_name = key_name.replace("ABS_HAT2X", "DPad 3")
-            key_name = key_name.replace("ABS_HAT2Y", "DPad 3")
-
-            key_name = key_name.replace("ABS_X", "Joystick")
-            key_name = key_name.replace("ABS_Y", "Joystick")
-            key_name = key_name.replace("ABS_RX", "Joystick 2")
-            key_name = key_name.replace("ABS_RY", "Joystick 2")
-
-            key_name = key_name.replace("BTN_", "Button ")
-            key_name = key_name.replace("KEY_", "")
-
-            key_name = key_name.replace("REL_", "")
-            key_name = key_name.replace("HWHEEL", "Wheel")
-            key_name = key_name.replace("WHEEL", "Wheel")
-
-            key_name = key_name.replace("_", " ")
-            key_name = key_name.replace("  ", " ")
-
-            result.append(key_name)
+            result.append(_prettify(key_name))
 
         return " + ".join(result)
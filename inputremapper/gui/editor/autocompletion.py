@@ -21,6 +21,7 @@
 """Autocompletion for the editor."""
 
 
+import functools
 import re
 
 from gi.repository import Gdk, Gtk, GLib, GObject
@@ -33,7 +34,6 @@ from inputremapper.injection.macros.parse import (
     remove_comments,
 )
 from inputremapper.injection.global_uinputs import global_uinputs
-from inputremapper.logger import logger
 from inputremapper.gui.utils import debounce
 
 
@@ -42,6 +42,17 @@ FUNCTION_NAMES = [name for name in FUNCTIONS.keys() if len(name) > 1]
 # no deprecated functions
 FUNCTION_NAMES.remove("ifeq")
 
+# the lowercase name to match against and the display name of each function, so
+# that they don't have to be built again for each function on each update
+FUNCTION_SUGGESTIONS = [
+    (
+        name,
+        name.lower(),
+        f"{name}({', '.join(get_macro_argument_names(FUNCTIONS[name]))})",
+    )
+    for name in FUNCTION_NAMES
+]
+
 
 def _get_left_text(iter):
     buffer = iter.get_buffer()
@@ -87,7 +98,6 @@ def get_incomplete_parameter(iter):
     #  foo
     #  bar + foo
     match = re.match(rf"(?:{PARAMETER}|^)(\w+)$", left_text)
-    logger.debug(f"get_incomplete_parameter text: %s match: %s", left_text, match)
 
     if match is None:
         return None
@@ -95,6 +105,12 @@ def get_incomplete_parameter(iter):
     return match[1]
 
 
+@functools.lru_cache(maxsize=8)
+def _get_lowercase_names(names):
+    """Pair each name with its lowercase version to match against."""
+    return tuple((name, name.lower()) for name in names)
+
+
 def propose_symbols(text_iter, codes):
     """Find key names that match the input at the cursor and are mapped to the codes."""
     incomplete_name = get_incomplete_parameter(text_iter)
@@ -104,10 +120,13 @@ def propose_symbols(text_iter, codes):
 
     incomplete_name = incomplete_name.lower()
 
+    # list_names returns the same tuple for the same codes, so the lowercase names
+    # are only built once and not for each known name on each update
+    names = tuple(system_mapping.list_names(codes=codes))
     return [
         (name, name)
-        for name in list(system_mapping.list_names(codes=codes))
-        if incomplete_name in name.lower() and incomplete_name != name.lower()
+        for name, lowercase in _get_lowercase_names(names)
+        if incomplete_name in lowercase and incomplete_name != lowercase
     ]
 
 
@@ -121,9 +140,9 @@ def propose_function_names(text_iter):
     incomplete_name = incomplete_name.lower()
 
     return [
-        (name, f"{name}({', '.join(get_macro_argument_names(FUNCTIONS[name]))})")
-        for name in FUNCTION_NAMES
-        if incomplete_name in name.lower() and incomplete_name != name.lower()
+        (name, display_name)
+        for name, lowercase, display_name in FUNCTION_SUGGESTIONS
+        if incomplete_name in lowercase and incomplete_name != lowercase
     ]
 
 
@@ -165,7 +184,7 @@ class Autocompletion(Gtk.Popover):
 
         self.text_input = text_input
         self.target_selector = target_selector
-        self._target_key_capabilities = []
+        self._target_key_capabilities = frozenset()
         target_selector.connect("changed", self._update_target_key_capabilities)
 
         self.scrolled_window = Gtk.ScrolledWindow(
@@ -317,8 +336,6 @@ class Autocompletion(Gtk.Popover):
             self.popdown()
             return
 
-        self.list_box.forall(self.list_box.remove)
-
         # move the autocompletion to the text cursor
         cursor = self.text_input.get_cursor_locations()[0]
         # convert it to window coords, because the cursor values will be very large
@@ -345,17 +362,34 @@ class Autocompletion(Gtk.Popover):
 
         self.popup()  # ffs was this hard to find
 
-        # add visible autocompletion entries
-        for suggestion, display_name in suggested_names:
-            label = SuggestionLabel(display_name, suggestion)
-            self.list_box.insert(label, -1)
-            label.show_all()
+        # add visible autocompletion entries. Reuse the rows of the previous
+        # suggestions, and only create or destroy rows for the difference
+        rows = self.list_box.get_children()
+        for index, (suggestion, display_name) in enumerate(suggested_names):
+            if index < len(rows):
+                label = rows[index].get_children()[0]
+                label.set_label(display_name)
+                label.suggestion = suggestion
+            else:
+                label = SuggestionLabel(display_name, suggestion)
+                self.list_box.insert(label, -1)
+
+        for row in rows[len(suggested_names) :]:
+            row.destroy()
+
+        # the previous selection doesn't mean anything for the new suggestions
+        self.list_box.unselect_all()
+
+        # show them all at once instead of one after the other
+        self.list_box.show_all()
 
     def _update_target_key_capabilities(self, *_):
         target = self.target_selector.get_active_id()
-        self._target_key_capabilities = global_uinputs.get_uinput(
-            target
-        ).capabilities()[EV_KEY]
+        # a frozenset, because list_names checks the code of each name against it,
+        # and remembers the result for it
+        self._target_key_capabilities = frozenset(
+            global_uinputs.get_uinput(target).capabilities()[EV_KEY]
+        )
 
     def _on_suggestion_clicked(self, _, selected_row):
         """An autocompletion suggestion was selected and should be inserted."""
@@ -61,8 +61,6 @@ class SelectionLabel(Gtk.ListBoxRow):
         self.label = label
         self.add(label)
 
-        self.show_all()
-
     def set_combination(self, combination: EventCombination):
         """Set the combination this button represents
 
@@ -70,6 +68,12 @@ class SelectionLabel(Gtk.ListBoxRow):
         ----------
         combination : EventCombination
         """
+        if combination is not None and (
+            combination is self.combination or combination == self.combination
+        ):
+            # the label already shows it, don't beautify it again
+            return
+
         self.combination = combination
         if combination:
             self.label.set_label(combination.beautify())
@@ -109,6 +113,10 @@ SET_KEY_FIRST = _("Set the key first")
 RECORD_ALL = float("inf")
 RECORD_NONE = 0
 
+# states of the key recording
+RECORDING_IDLE = 0
+RECORDING_INPUT_ARRIVED = 1
+
 
 class Editor:
     """Maintains the widgets of the editor."""
@@ -116,6 +124,18 @@ class Editor:
     def __init__(self, user_interface):
         self.user_interface = user_interface
 
+        # the widgets from the glade file are created once and never replaced
+        self._widgets = {}
+
+        # the contents of the text input, None if it has to be read again
+        self._symbol_input_text = None
+
+        # the state of the recording toggle, kept up to date by its toggled signal
+        self._is_waiting_for_input = False
+
+        # if moving the focus to the text input is already scheduled
+        self._focus_pending = False
+
         self.autocompletion = None
 
         self._setup_target_selector()
@@ -124,7 +144,6 @@ class Editor:
 
         self.window = self.get("window")
         self.timeouts = [
-            GLib.timeout_add(100, self.check_add_new_key),
             GLib.timeout_add(1000, self.update_toggle_opacity),
         ]
         self.active_selection_label: SelectionLabel = None
@@ -135,7 +154,7 @@ class Editor:
         self.device = user_interface.group
 
         # keys were not pressed yet
-        self._input_has_arrived = False
+        self._recording_state = RECORDING_IDLE
 
         self.record_events_until = RECORD_NONE
 
@@ -212,7 +231,9 @@ class Editor:
     def clear_mapping_list(self):
         """Clear the labels from the mapping selection and add an empty one."""
         selection_label_listbox = self.get("selection_label_listbox")
-        selection_label_listbox.forall(selection_label_listbox.remove)
+        for selection_label in selection_label_listbox.get_children():
+            selection_label.destroy()
+
         self.add_empty()
         selection_label_listbox.select_row(selection_label_listbox.get_children()[0])
 
@@ -241,15 +262,26 @@ class Editor:
         # Don't leave the input when using arrow keys or tab. wait for the
         # window to consume the keycode from the reader. I.e. a tab input should
         # be recorded, instead of causing the recording to stop.
-        toggle.connect("key-press-event", lambda *args: Gdk.EVENT_STOP)
+        toggle.connect("key-press-event", self._on_recording_toggle_key_press)
+
+    def _on_recording_toggle_key_press(self, *_):
+        """Don't leave the toggle when using arrow keys or tab while it is focused."""
+        return Gdk.EVENT_STOP
 
     def _show_press_key(self, *args):
         """Show user friendly instructions."""
-        self.get_recording_toggle().set_label(_("Press Key"))
+        self._set_recording_toggle_label(_("Press Key"))
 
     def _show_change_key(self, *args):
         """Show user friendly instructions."""
-        self.get_recording_toggle().set_label(_("Change Key"))
+        self._set_recording_toggle_label(_("Change Key"))
+
+    def _set_recording_toggle_label(self, label):
+        """Change the label of the toggle, if it isn't already showing it."""
+        # this happens for each click and each change of the focus
+        toggle = self.get_recording_toggle()
+        if toggle.get_label() != label:
+            toggle.set_label(label)
 
     def _setup_source_view(self):
         """Prepare the code editor."""
@@ -263,6 +295,8 @@ class Editor:
         # effect.
         source_view.set_resize_mode(Gtk.ResizeMode.IMMEDIATE)
 
+        # connected first, so that no other handler can read outdated text
+        source_view.get_buffer().connect("changed", self._on_text_input_changed)
         source_view.get_buffer().connect("changed", self.show_line_numbers_if_multiline)
 
         # Syntax Highlighting
@@ -279,6 +313,10 @@ class Editor:
         autocompletion.connect("suggestion-inserted", self.gather_changes_and_save)
         self.autocompletion = autocompletion
 
+    def _on_text_input_changed(self, *_):
+        """Forget the cached contents of the text input."""
+        self._symbol_input_text = None
+
     def show_line_numbers_if_multiline(self, *_):
         """Show line numbers if a macro is being edited."""
         code_editor = self.get("code_editor")
@@ -309,8 +347,6 @@ class Editor:
         else:
             self.add_empty()
 
-        return True
-
     def disable_symbol_input(self, clear=False):
         """Display help information and dont allow entering a symbol.
 
@@ -338,9 +374,7 @@ class Editor:
         text_input.set_sensitive(True)
         text_input.set_opacity(1)
 
-        buffer = text_input.get_buffer()
-        symbol = buffer.get_text(buffer.get_start_iter(), buffer.get_end_iter(), True)
-        if symbol == SET_KEY_FIRST:
+        if self._get_text_input_contents() == SET_KEY_FIRST:
             # don't overwrite user input
             self.set_symbol_input_text("")
 
@@ -384,28 +418,32 @@ class Editor:
             self.enable_symbol_input()
             self.enable_target_selector()
 
-        self.get("window").set_focus(self.get_text_input())
+        self.window.set_focus(self.get_text_input())
 
     def add_empty(self):
         """Add one empty row for a single mapped key."""
         selection_label_listbox = self.get("selection_label_listbox")
         mapping_selection = SelectionLabel()
         mapping_selection.set_label(_("new entry"))
-        mapping_selection.show_all()
         selection_label_listbox.insert(mapping_selection, -1)
+        mapping_selection.show_all()
 
     @ensure_everything_saved
     def load_custom_mapping(self):
         """Display the entries in active_preset."""
         selection_label_listbox = self.get("selection_label_listbox")
 
-        selection_label_listbox.forall(selection_label_listbox.remove)
+        for selection_label in selection_label_listbox.get_children():
+            selection_label.destroy()
 
         for key, _ in active_preset:
             selection_label = SelectionLabel()
             selection_label.set_combination(key)
             selection_label_listbox.insert(selection_label, -1)
 
+        # new rows are not shown yet, show all of them at once
+        selection_label_listbox.show_all()
+
         self.check_add_new_key()
 
         # select the first entry
@@ -430,6 +468,9 @@ class Editor:
         """Show what the user is currently pressing in the user interface."""
         self.active_selection_label.set_combination(combination)
 
+        # the "new entry" might have just been configured, offer another one
+        self.check_add_new_key()
+
         if combination and len(combination) > 0:
             self.enable_symbol_input()
         else:
@@ -446,7 +487,11 @@ class Editor:
         return self.active_selection_label.combination
 
     def set_symbol_input_text(self, symbol):
-        self.get("code_editor").get_buffer().set_text(symbol or "")
+        symbol = symbol or ""
+        if symbol != self._get_text_input_contents():
+            # avoid emitting all the change signals if the text is already there
+            self.get("code_editor").get_buffer().set_text(symbol)
+
         # move cursor location to the beginning, like any code editor does
         Gtk.TextView.do_move_cursor(
             self.get("code_editor"),
@@ -464,8 +509,7 @@ class Editor:
         If there is no symbol, this returns None. This is important for some other
         logic down the road in active_preset or something.
         """
-        buffer = self.get("code_editor").get_buffer()
-        symbol = buffer.get_text(buffer.get_start_iter(), buffer.get_end_iter(), True)
+        symbol = self._get_text_input_contents()
 
         if symbol == SET_KEY_FIRST:
             # not configured yet
@@ -473,6 +517,16 @@ class Editor:
 
         return symbol.strip()
 
+    def _get_text_input_contents(self):
+        """Get the unmodified text of the text input."""
+        if self._symbol_input_text is None:
+            buffer = self.get("code_editor").get_buffer()
+            self._symbol_input_text = buffer.get_text(
+                buffer.get_start_iter(), buffer.get_end_iter(), True
+            )
+
+        return self._symbol_input_text
+
     def set_target_selection(self, target):
         selector = self.get_target_selector()
         selector.set_active_id(target)
@@ -482,7 +536,12 @@ class Editor:
 
     def get(self, name):
         """Get a widget from the window"""
-        return self.user_interface.builder.get_object(name)
+        widget = self._widgets.get(name)
+        if widget is None:
+            widget = self.user_interface.builder.get_object(name)
+            self._widgets[name] = widget
+
+        return widget
 
     def update_toggle_opacity(self):
         """If the key can't be mapped, grey it out.
@@ -500,6 +559,8 @@ class Editor:
 
     def _on_recording_toggle_toggle(self, toggle):
         """Refresh useful usage information."""
+        self._is_waiting_for_input = toggle.get_active()
+
         if not toggle.get_active():
             # if more events arrive from the time when the toggle was still on,
             # use them.
@@ -573,7 +634,8 @@ class Editor:
 
     def is_waiting_for_input(self):
         """Check if the user is trying to record buttons."""
-        return self.get_recording_toggle().get_active()
+        # this is asked on each iteration of the gui
+        return self._is_waiting_for_input
 
     def should_record_combination(self, combination):
         """Check if the combination was written when the toggle was active."""
@@ -626,7 +688,7 @@ class Editor:
         previous_key = self.get_combination()
 
         # it might end up being a key combination, wait for more
-        self._input_has_arrived = True
+        self._recording_state = RECORDING_INPUT_ARRIVED
 
         # keycode didn't change, do nothing
         if combination == previous_key:
@@ -669,24 +731,30 @@ class Editor:
             self._reset_keycode_consumption()
             return
 
-        all_keys_released = reader.get_unreleased_keys() is None
-        if all_keys_released and self._input_has_arrived and self.get_combination():
+        if reader.has_unreleased_keys():
+            # currently the user is using the widget, and certain keys have already
+            # reached it.
+            self._recording_state = RECORDING_INPUT_ARRIVED
+            return
+
+        if self._recording_state == RECORDING_INPUT_ARRIVED and self.get_combination():
             logger.debug("Recording complete")
             # A key was pressed and then released.
             # Switch to the symbol. idle_add this so that the
             # keycode event won't write into the symbol input as well.
-            window = self.user_interface.window
             self.enable_symbol_input()
             self.enable_target_selector()
-            GLib.idle_add(lambda: window.set_focus(self.get_text_input()))
-
-        if not all_keys_released:
-            # currently the user is using the widget, and certain keys have already
-            # reached it.
-            self._input_has_arrived = True
-            return
+            if not self._focus_pending:
+                self._focus_pending = True
+                GLib.idle_add(self._focus_text_input)
 
         self._reset_keycode_consumption()
 
+    def _focus_text_input(self):
+        """Move the focus to the text input, for use with GLib.idle_add."""
+        self._focus_pending = False
+        self.window.set_focus(self.get_text_input())
+        return False
+
     def _reset_keycode_consumption(self, *_):
-        self._input_has_arrived = False
+        self._recording_state = RECORDING_IDLE
@@ -132,14 +132,23 @@ class Reader:
 
         self._debounce_tick()
 
-        while self._results.poll():
-            message = self._results.recv()
+        # a burst of events is drained here in one go, so don't look up the same
+        # things again for each event
+        results = self._results
+        should_map_as_btn = utils.should_map_as_btn
+        gamepad = None
+
+        while results.poll():
+            message = results.recv()
             event = self._get_event(message)
             if event is None:
                 continue
 
-            gamepad = GAMEPAD in self.group.types
-            if not utils.should_map_as_btn(event, active_preset, gamepad):
+            if gamepad is None:
+                # the group doesn't change while reading
+                gamepad = GAMEPAD in self.group.types
+
+            if not should_map_as_btn(event, active_preset, gamepad):
                 continue
 
             if event.value == 0:
@@ -222,6 +231,10 @@ class Reader:
 
         return EventCombination.from_events(unreleased)
 
+    def has_unreleased_keys(self):
+        """Check if any keys are held down, without creating an EventCombination."""
+        return len(self._unreleased) > 0
+
     def _release(self, type_code):
         """Modify the state to recognize the releasing of the key."""
         if type_code in self._unreleased:
@@ -408,6 +408,8 @@ class UserInterface:
         # letting go of one of the keys of a combination won't just make
         # it return the leftover key, it will continue to return None because
         # they have already been read.
+        # A burst of events, like a held key, is drained in one go by the reader,
+        # so the editor only sees the newest combination once per iteration.
         combination = reader.read()
 
         if reader.are_new_groups_available():
@@ -66,6 +66,8 @@ class HandlerDisabled:
     Use in a with statement.
     """
 
+    __slots__ = ("widget", "handler")
+
     def __init__(self, widget, handler):
         self.widget = widget
         self.handler = handler
@@ -71,7 +71,11 @@ from inputremapper.gui.reader import reader
 from inputremapper.gui.helper import RootHelper
 from inputremapper.gui.utils import gtk_iteration
 from inputremapper.gui.user_interface import UserInterface
-from inputremapper.gui.editor.editor import SET_KEY_FIRST
+from inputremapper.gui.editor.editor import (
+    SET_KEY_FIRST,
+    RECORDING_IDLE,
+    RECORDING_INPUT_ARRIVED,
+)
 from inputremapper.injection.injector import RUNNING, FAILED, UNKNOWN
 from inputremapper.event_combination import EventCombination
 from inputremapper.daemon import Daemon
@@ -409,14 +413,13 @@ class GuiTestBase(unittest.TestCase):
 
         changed = active_preset.has_unsaved_changes()
 
-        # wait for the window to create a new empty selection_label if needed
-        time.sleep(0.1)
+        # editor.set_combination already added a new empty selection_label if needed
         gtk_iteration()
 
         # the empty selection_label is expected to be the last one
         selection_label = self.select_mapping(-1)
         self.assertIsNone(selection_label.get_combination())
-        self.assertFalse(self.editor._input_has_arrived)
+        self.assertEqual(self.editor._recording_state, RECORDING_IDLE)
 
         if self.toggle.get_active():
             self.assertEqual(self.toggle.get_label(), "Press Key")
@@ -443,7 +446,7 @@ class GuiTestBase(unittest.TestCase):
             # holding down
             self.assertIsNotNone(reader.get_unreleased_keys())
             self.assertGreater(len(reader.get_unreleased_keys()), 0)
-            self.assertTrue(self.editor._input_has_arrived)
+            self.assertEqual(self.editor._recording_state, RECORDING_INPUT_ARRIVED)
             self.assertTrue(self.toggle.get_active())
 
             # release all the keys
@@ -455,7 +458,7 @@ class GuiTestBase(unittest.TestCase):
 
             # released
             self.assertIsNone(reader.get_unreleased_keys())
-            self.assertFalse(self.editor._input_has_arrived)
+            self.assertEqual(self.editor._recording_state, RECORDING_IDLE)
 
             if expect_success:
                 self.assertEqual(self.editor.get_combination(), key)
@@ -472,7 +475,7 @@ class GuiTestBase(unittest.TestCase):
         if not expect_success:
             self.assertIsNone(selection_label.get_combination())
             self.assertEqual(self.editor.get_symbol_input_text(), "")
-            self.assertFalse(self.editor._input_has_arrived)
+            self.assertEqual(self.editor._recording_state, RECORDING_IDLE)
             # it won't switch the focus to the symbol input
             self.assertTrue(self.toggle.get_active())
             self.assertEqual(active_preset.has_unsaved_changes(), changed)
@@ -794,6 +797,23 @@ class TestGui(GuiTestBase):
         self.disable_recording_toggle()
         self.assertFalse(self.editor.is_waiting_for_input())
 
+    def test_set_combination_adds_empty_selection_label(self):
+        self.assertEqual(len(self.selection_label_listbox.get_children()), 1)
+        selection_label = self.selection_label_listbox.get_children()[0]
+        self.assertIs(self.editor.active_selection_label, selection_label)
+
+        # the new entry is added right away, without waiting for the gui
+        combination = EventCombination((EV_KEY, 30, 1))
+        self.editor.set_combination(combination)
+        selection_labels = self.selection_label_listbox.get_children()
+        self.assertEqual(len(selection_labels), 2)
+        self.assertEqual(selection_labels[0].get_combination(), combination)
+        self.assertIsNone(selection_labels[1].get_combination())
+
+        # there is already an empty one, so no other one is added
+        self.editor.set_combination(EventCombination((EV_KEY, 31, 1)))
+        self.assertEqual(len(self.selection_label_listbox.get_children()), 2)
+
     def test_editor_simple(self):
         self.assertEqual(self.toggle.get_label(), "Change Key")
 
@@ -828,9 +848,7 @@ class TestGui(GuiTestBase):
         self.assertEqual(len(selection_label.get_combination()), 1)
         self.assertEqual(selection_label.get_combination()[0], (EV_KEY, 30, 1))
 
-        time.sleep(0.11)
         # new empty entry was added
-        gtk_iteration()
         self.assertEqual(
             len(self.selection_label_listbox.get_children()),
             2,
@@ -848,7 +866,6 @@ class TestGui(GuiTestBase):
         num_mappings = len(active_preset)
         self.assertEqual(num_mappings, 1)
 
-        time.sleep(0.1)
         gtk_iteration()
         self.assertEqual(
             len(self.selection_label_listbox.get_children()),
@@ -865,7 +882,6 @@ class TestGui(GuiTestBase):
         self.assertEqual(selection_label.get_combination()[0], (EV_KEY, 30, 1))
 
         self.editor.set_target_selection("mouse")
-        time.sleep(0.1)
         gtk_iteration()
         self.assertEqual(
             len(self.selection_label_listbox.get_children()),
@@ -957,7 +973,6 @@ class TestGui(GuiTestBase):
         self.add_mapping_via_ui(ev_2, "k(b).k(c)")
 
         # one empty selection_label added automatically again
-        time.sleep(0.1)
         gtk_iteration()
         self.assertEqual(len(self.get_selection_labels()), num_selection_labels_target)
 
@@ -1483,7 +1498,6 @@ class TestGui(GuiTestBase):
     def test_copy_preset(self):
         selection_labels = self.selection_label_listbox
         self.add_mapping_via_ui(EventCombination([EV_KEY, 81, 1]), "a")
-        time.sleep(0.1)
         gtk_iteration()
         self.user_interface.save_preset()
         # 2 selection_labels: the changed selection_label and an empty selection_label
@@ -1501,7 +1515,6 @@ class TestGui(GuiTestBase):
 
         # add one new selection_label again and a setting
         self.add_mapping_via_ui(EventCombination([EV_KEY, 81, 1]), "b")
-        time.sleep(0.1)
         gtk_iteration()
         self.user_interface.save_preset()
         self.assertEqual(len(selection_labels.get_children()), 2)
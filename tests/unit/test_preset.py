@@ -80,6 +80,27 @@ class TestSystemMapping(unittest.TestCase):
         self.assertEqual(system_mapping.get("ABCD_b"), 33)
         self.assertEqual(system_mapping.get("abcd_B"), 33)
 
+    def test_correct_case_cache(self):
+        system_mapping = SystemMapping()
+        system_mapping.clear()
+        self.assertEqual(system_mapping.correct_case("FOo"), "FOo")
+
+        # the cached result is discarded when the mapping changes
+        system_mapping._set("foo", 34)
+        self.assertEqual(system_mapping.correct_case("FOo"), "foo")
+
+    def test_list_names_cache(self):
+        system_mapping = SystemMapping()
+        system_mapping.clear()
+        system_mapping._set("a", 31)
+        system_mapping._set("b", 32)
+        self.assertEqual(list(system_mapping.list_names([31])), ["a"])
+
+        # the cached result is discarded when the mapping changes
+        system_mapping._set("c", 31)
+        self.assertEqual(sorted(system_mapping.list_names([31])), ["a", "c"])
+        self.assertEqual(list(system_mapping.list_names(frozenset([32]))), ["b"])
+
     def test_system_mapping(self):
         system_mapping = SystemMapping()
         system_mapping.populate()
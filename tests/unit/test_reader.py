@@ -138,6 +138,7 @@ class TestReader(unittest.TestCase):
             reader.get_unreleased_keys(), EventCombination((EV_REL, REL_WHEEL, 1))
         )
         self.assertIsInstance(reader.get_unreleased_keys(), EventCombination)
+        self.assertTrue(reader.has_unreleased_keys())
 
         # as long as new wheel events arrive, it is considered unreleased
         for _ in range(10):
@@ -150,6 +151,7 @@ class TestReader(unittest.TestCase):
             self.assertEqual(reader.read(), None)
         self.assertEqual(len(reader._unreleased), 0)
         self.assertIsNone(reader.get_unreleased_keys())
+        self.assertFalse(reader.has_unreleased_keys())
 
         """combinations"""
 